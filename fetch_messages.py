@@ -3,39 +3,118 @@ from __future__ import annotations
 """Retrieve Instagram conversation messages and their contents."""
 
 import argparse
+import asyncio
+import codecs
+import importlib.util
 import json
+import os
+import queue
+import re
 import sys
+import textwrap
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Iterable, Iterator, Optional
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterable, Iterator, Mapping, Optional, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
 
-CONVERSATION_MESSAGES_URL_TEMPLATE = "https://graph.instagram.com/v22.0/{conversation_id}/messages"
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional dependency
+    simdjson = None  # type: ignore[assignment]
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+GRAPH_API_BASE_URL = "https://graph.instagram.com/v22.0"
 MESSAGE_FIELDS = "id,from,to,message,created_time"
+# The Textual table never shows recipients, so it skips the per-message
+# "to" list (which repeats every participant) when paging.
+TABLE_MESSAGE_FIELDS = "id,from,message,created_time"
+# Shared, never mutated: passed as-is for every first-page request.
+MESSAGE_PARAMS = {"fields": MESSAGE_FIELDS}
+TABLE_MESSAGE_PARAMS = {"fields": TABLE_MESSAGE_FIELDS}
+RAW_OUTPUT_BUFFER_SIZE = 1 << 20
+# Conversations downloaded at once in --raw mode; keeps bursts under the
+# Graph API rate limits and below the connection pool size.
+MAX_CONCURRENT_CONVERSATIONS = 8
 EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+TEXT_KEYS = ("text", "body", "message")
+# The exact shape the Graph API returns, e.g. 2024-01-01T12:00:00+0000.
+GRAPH_TIMESTAMP_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}[+-][0-9]{4}")
+
+# pysimdjson hands out lazy proxies instead of dicts; accept both.
+if simdjson is not None:
+    MAPPING_TYPES: tuple[type[Any], ...] = (dict, simdjson.Object)
+else:
+    MAPPING_TYPES = (dict,)
+
+# One keep-alive session so consecutive pages reuse the same TLS connection.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
 
 
+def _authorized_session(token: str) -> requests.Session:
+    """Return the shared session with its Authorization header set for ``token``."""
+    authorization = f"Bearer {token}"
+    if _SESSION.headers.get("Authorization") != authorization:
+        _SESSION.headers["Authorization"] = authorization
+    return _SESSION
+
+
+@lru_cache(maxsize=4096)
 def parse_created_time(value: Optional[str]) -> Optional[datetime]:
     """Convert an ISO8601 timestamp string into a datetime object."""
     if not value:
         return None
+    # Fast path only for the Graph API shape, since fromisoformat() accepts
+    # more than the strptime format below. Older fromisoformat() versions
+    # need the offset written as +00:00.
+    if GRAPH_TIMESTAMP_RE.fullmatch(value):
+        try:
+            return datetime.fromisoformat(f"{value[:-2]}:{value[-2:]}")
+        except ValueError:
+            pass
     try:
         return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
     except ValueError:
         return None
 
 
-def extract_message_text(data: dict) -> Optional[str]:
-    """Return a textual representation of a message if available."""
+def message_sort_key(message: Mapping[str, Any]) -> tuple[float, str]:
+    """Return the ``(created timestamp, id)`` key messages are ordered by."""
+    created = parse_created_time(message.get("created_time")) or EPOCH
+    return created.timestamp(), message.get("id", "")
+
+
+def sort_messages(
+    messages: Iterable[Mapping[str, Any]], *, reverse: bool = False
+) -> list[Mapping[str, Any]]:
+    """Return ``messages`` ordered by :func:`message_sort_key`, keeping ties stable."""
+    return sorted(messages, key=message_sort_key, reverse=reverse)
+
+
+def _from_candidate(candidate: object) -> Optional[str]:
+    # Decoded JSON strings are always exact ``str``; the identity check is
+    # cheaper than isinstance for this per-field hot path.
+    return (candidate.strip() or None) if type(candidate) is str else None
 
-    def _from_candidate(candidate: Optional[str]) -> Optional[str]:
-        if isinstance(candidate, str):
-            text = candidate.strip()
-            if text:
-                return text
-        return None
 
+def extract_message_text(data: Mapping[str, Any]) -> Optional[str]:
+    """Return a textual representation of a message if available."""
     direct = _from_candidate(data.get("message"))
     if direct:
         return direct
@@ -45,23 +124,23 @@ def extract_message_text(data: dict) -> Optional[str]:
         text = _from_candidate(text_field)
         if text:
             return text
-    elif isinstance(text_field, dict):
-        for key in ("text", "body", "message"):
+    elif isinstance(text_field, MAPPING_TYPES):
+        for key in TEXT_KEYS:
             text = _from_candidate(text_field.get(key))
             if text:
                 return text
 
     attachments = data.get("attachments")
-    if isinstance(attachments, dict):
+    if isinstance(attachments, MAPPING_TYPES):
         for item in attachments.get("data", []):
-            if not isinstance(item, dict):
+            if not isinstance(item, MAPPING_TYPES):
                 continue
             text = _from_candidate(item.get("text"))
             if text:
                 return text
             payload = item.get("payload")
-            if isinstance(payload, dict):
-                for key in ("text", "body", "message"):
+            if isinstance(payload, MAPPING_TYPES):
+                for key in TEXT_KEYS:
                     text = _from_candidate(payload.get(key))
                     if text:
                         return text
@@ -69,62 +148,186 @@ def extract_message_text(data: dict) -> Optional[str]:
     return None
 
 
+def _to_builtin(data: object) -> object:
+    if simdjson is not None and isinstance(data, (simdjson.Object, simdjson.Array)):
+        return data.as_dict() if isinstance(data, simdjson.Object) else data.as_list()
+    return data
+
+
+def dump_json(data: object, *, indent: bool = False) -> str:
+    """Serialize ``data`` with sorted keys, preferring orjson when installed."""
+    data = _to_builtin(data)
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option).decode()
+    # Match orjson's output: UTF-8 text rather than \u escapes, and compact
+    # separators unless indenting.
+    if indent:
+        return json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False)
+    return json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def dump_json_bytes(data: object) -> bytes:
+    """Serialize ``data`` compactly with sorted keys as UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(_to_builtin(data), option=orjson.OPT_SORT_KEYS)
+    return dump_json(data).encode()
+
+
+def write_stdout_bytes(buffer: bytearray) -> None:
+    """Write and clear UTF-8 ``buffer`` after anything already printed to stdout."""
+    sys.stdout.flush()
+    binary = getattr(sys.stdout, "buffer", None)
+    if binary is not None and os.linesep == "\n" and _is_utf8(sys.stdout.encoding):
+        binary.write(buffer)
+        binary.flush()
+    else:
+        # Let the text layer apply its encoding and newline translation so
+        # the output matches the print()ed lines around it.
+        sys.stdout.write(buffer.decode())
+    buffer.clear()
+
+
+def _is_utf8(encoding: Optional[str]) -> bool:
+    try:
+        return codecs.lookup(encoding or "").name == "utf-8"
+    except LookupError:
+        return False
+
+
 def fetch_conversation_page(
     conversation_id: str,
     token: str,
     *,
     page_url: Optional[str] = None,
     params: Optional[dict[str, str]] = None,
-) -> tuple[list[dict], dict] | tuple[None, None]:
-    """Return a single page of conversation metadata and paging info."""
-    url = page_url or CONVERSATION_MESSAGES_URL_TEMPLATE.format(conversation_id=conversation_id)
-    headers = {"Authorization": f"Bearer {token}"}
+    lazy: bool = True,
+) -> tuple[Sequence[Mapping[str, Any]], Mapping[str, Any]] | tuple[None, None]:
+    """Return a single page of conversation metadata and paging info.
+
+    With ``lazy`` set and pysimdjson installed, the page is returned as lazy
+    proxies so only the fields that are actually read get materialized.
+    """
     if page_url is None:
-        effective_params = {"fields": MESSAGE_FIELDS}
-        if params:
-            effective_params.update(params)
+        url = f"{GRAPH_API_BASE_URL}/{conversation_id}/messages"
+        effective_params: Optional[dict[str, str]]
+        if not params:
+            effective_params = MESSAGE_PARAMS
+        elif params.keys() >= MESSAGE_PARAMS.keys():
+            # Every default is overridden, so the caller's dict is used as-is.
+            effective_params = params
+        else:
+            effective_params = {**MESSAGE_PARAMS, **params}
     else:
+        url = page_url
         effective_params = None
 
     try:
-        response = requests.get(url, headers=headers, params=effective_params, timeout=30)
+        response = _authorized_session(token).get(url, params=effective_params, timeout=30)
         response.raise_for_status()
     except requests.RequestException as exc:  # pragma: no cover - defensive
         print(f"error: failed to fetch conversation {conversation_id}: {exc}", file=sys.stderr)
         return None, None
 
+    return _decode_page(response, conversation_id, lazy=lazy)
+
+
+def _decode_page(
+    response: Any, conversation_id: str, *, lazy: bool
+) -> tuple[Sequence[Mapping[str, Any]], Mapping[str, Any]] | tuple[None, None]:
+    """Decode a requests or httpx response body into message data and paging info."""
+    payload: Any
     try:
-        payload = response.json()
+        if lazy and simdjson is not None:
+            # A shared parser cannot be reused while proxies from an earlier
+            # page (e.g. cached Textual pages) are alive, so use one per page.
+            payload = simdjson.Parser().parse(response.content)
+        elif orjson is not None:
+            payload = orjson.loads(response.content)
+        else:
+            # json.loads detects UTF-8/16/32 from the raw bytes itself, which
+            # skips the charset guessing response.json() may fall back to.
+            payload = json.loads(response.content)
     except ValueError:  # pragma: no cover - invalid JSON
         print(f"error: conversation {conversation_id} did not return JSON", file=sys.stderr)
         return None, None
 
-    container = payload.get("messages", payload)
-    data = container.get("data", [])
-    if not isinstance(data, list):
-        data = []
-    paging = container.get("paging", {}) or {}
+    try:
+        container = payload.get("messages", payload)
+        data = container["data"]
+        paging = container.get("paging") or {}
+    except (AttributeError, KeyError, TypeError):
+        data, paging = [], {}
     return data, paging
 
 
 def iter_conversation_pages(
-    conversation_id: str, token: str, page_limit: int = 0
-) -> Iterator[tuple[list[dict], dict]]:
-    """Yield pages of conversation metadata and their paging details."""
-    url = None
-    params: dict[str, str] | None = {}
+    conversation_id: str, token: str, page_limit: int = 0, *, lazy: bool = True
+) -> Iterator[tuple[Sequence[Mapping[str, Any]], Mapping[str, Any]]]:
+    """Yield pages of conversation metadata and their paging details.
+
+    The next page is requested in the background while the caller is still
+    processing the current one.
+    """
+    # Like the original loop, a negative limit fetches nothing.
+    if page_limit < 0:
+        return
     page_count = 0
 
-    while True:
-        if page_limit and page_count >= page_limit:
-            return
-        data, paging = fetch_conversation_page(
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future: Optional[Future] = executor.submit(
+            fetch_conversation_page,
             conversation_id,
             token,
-            page_url=url,
-            params=params,
+            page_url=None,
+            params={},
+            lazy=lazy,
         )
-        if data is None:
+        while future is not None:
+            data, paging = future.result()
+            if data is None:
+                return
+
+            page_count += 1
+            url = paging.get("next")
+            future = None
+            if url and not (page_limit and page_count >= page_limit):
+                future = executor.submit(
+                    fetch_conversation_page,
+                    conversation_id,
+                    token,
+                    page_url=url,
+                    params=None,
+                    lazy=lazy,
+                )
+
+            yield data, paging
+
+
+async def aiter_conversation_pages(
+    client: httpx.AsyncClient,
+    conversation_id: str,
+    page_limit: int = 0,
+    *,
+    lazy: bool = True,
+) -> AsyncIterator[tuple[Sequence[Mapping[str, Any]], Mapping[str, Any]]]:
+    """Asynchronously yield pages of a conversation using an authorized httpx client."""
+    url: Optional[str] = f"{GRAPH_API_BASE_URL}/{conversation_id}/messages"
+    params: Optional[dict[str, str]] = MESSAGE_PARAMS
+    page_count = 0
+
+    while url and not (page_limit and page_count >= page_limit):
+        try:
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPError as exc:  # pragma: no cover - defensive
+            print(f"error: failed to fetch conversation {conversation_id}: {exc}", file=sys.stderr)
+            return
+
+        data, paging = _decode_page(response, conversation_id, lazy=lazy)
+        if data is None or paging is None:
             return
 
         yield data, paging
@@ -132,70 +335,227 @@ def iter_conversation_pages(
         page_count += 1
         url = paging.get("next")
         params = None
-        if not url:
-            return
+
+
+async def fetch_all_conversation_pages(
+    conversation_ids: list[str],
+    token: str,
+    page_limit: int,
+    handoff: queue.Queue[Future],
+    release_ready: Future,
+    *,
+    lazy: bool = True,
+) -> None:
+    """Fetch the message pages of several conversations concurrently.
+
+    One future per conversation is put on ``handoff`` in input order and
+    resolved with its pages once they are all in. Pages of a single
+    conversation are still requested one after another, since each ``next``
+    link comes from the previous response.
+
+    A slot is taken before each download starts and is only returned through
+    the callable published on ``release_ready``, which the consumer calls once
+    it is done with a conversation. At most MAX_CONCURRENT_CONVERSATIONS are
+    therefore downloading or waiting to be printed at any time.
+    """
+    slots = asyncio.Semaphore(MAX_CONCURRENT_CONVERSATIONS)
+    loop = asyncio.get_running_loop()
+
+    def release() -> None:
+        try:
+            loop.call_soon_threadsafe(slots.release)
+        except RuntimeError:  # loop already finished; nothing waits for slots
+            pass
+
+    release_ready.set_result(release)
+
+    async with httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=20),
+        headers={"Authorization": f"Bearer {token}"},
+        # Waiting for a pooled connection is not a failed request.
+        timeout=httpx.Timeout(30, pool=None),
+    ) as client:
+
+        async def collect(conversation_id: str, future: Future) -> None:
+            try:
+                pages = [
+                    data
+                    async for data, _paging in aiter_conversation_pages(
+                        client, conversation_id, page_limit, lazy=lazy
+                    )
+                ]
+            except BaseException as exc:
+                future.set_exception(exc)
+                raise
+            future.set_result(pages)
+
+        tasks = []
+        for conversation_id in conversation_ids:
+            await slots.acquire()
+            future: Future = Future()
+            handoff.put(future)
+            tasks.append(asyncio.create_task(collect(conversation_id, future)))
+        await asyncio.gather(*tasks)
+
+
+def iter_concurrent_conversation_pages(
+    conversation_ids: list[str], token: str, page_limit: int = 0, *, lazy: bool = True
+) -> Iterator[list[Sequence[Mapping[str, Any]]]]:
+    """Yield each conversation's pages in input order while later ones download.
+
+    The httpx event loop runs in a background thread and never runs more than
+    MAX_CONCURRENT_CONVERSATIONS ahead of the caller, so only that many
+    conversations are held in memory at once.
+    """
+    handoff: queue.Queue[Future] = queue.Queue()
+    release_ready: Future = Future()
+
+    def run() -> None:
+        try:
+            asyncio.run(
+                fetch_all_conversation_pages(
+                    conversation_ids, token, page_limit, handoff, release_ready, lazy=lazy
+                )
+            )
+        except Exception as exc:  # pragma: no cover - surfaced to the caller below
+            failed: Future = Future()
+            failed.set_exception(exc)
+            handoff.put(failed)
+
+    threading.Thread(target=run, daemon=True).start()
+    for _conversation_id in conversation_ids:
+        # Not bound to a name, so a consumed conversation is freed as soon as
+        # the caller is done with it.
+        yield handoff.get().result()
+        release_ready.result()()
 
 
 def iter_enriched_messages(
-    conversation_id: str, token: str, order: str, page_limit: int
-) -> Iterator[dict]:
+    conversation_id: str, token: str, order: str, page_limit: int, *, lazy: bool = True
+) -> Iterator[Mapping[str, Any]]:
     """Yield detailed message data for a conversation in the requested order."""
-    key = lambda msg: (
-        parse_created_time(msg.get("created_time")) or EPOCH,
-        msg.get("id", ""),
+    pages = (
+        data
+        for data, _paging in iter_conversation_pages(
+            conversation_id, token, page_limit=page_limit, lazy=lazy
+        )
     )
+    return enrich_pages(pages, order)
+
 
+def enrich_pages(
+    pages: Iterable[Sequence[Mapping[str, Any]]], order: str
+) -> Iterator[Mapping[str, Any]]:
+    """Yield normalized messages from already fetched pages in the requested order."""
     if order == "asc":
-        collected: list[dict] = []
-        for page_messages, _paging in iter_conversation_pages(
-            conversation_id, token, page_limit=page_limit
-        ):
+        collected: list[Mapping[str, Any]] = []
+        # The whole conversation is held until sorted, and senders repeat on
+        # nearly every message; keep one dict per distinct sender.
+        senders: dict[tuple, dict] = {}
+        for page_messages in pages:
             for message in page_messages:
                 normalized = normalize_message(message)
                 if normalized is not None:
+                    _share_sender(normalized, senders)
                     collected.append(normalized)
         if not collected:
             return
-        collected.sort(key=key)
+        collected.sort(key=message_sort_key)
         for message in collected:
             yield message
         return
 
-    for page_messages, _paging in iter_conversation_pages(
-        conversation_id, token, page_limit=page_limit
-    ):
-        detailed_page: list[dict] = []
+    for page_messages in pages:
+        detailed_page: list[Mapping[str, Any]] = []
         for message in page_messages:
             normalized = normalize_message(message)
             if normalized is not None:
                 detailed_page.append(normalized)
         if not detailed_page:
             continue
-        detailed_page.sort(key=key, reverse=True)
-        for message in detailed_page:
+        for message in sort_messages(detailed_page, reverse=True):
             yield message
 
 
-def normalize_message(message: object) -> Optional[dict]:
-    if not isinstance(message, dict):
+def _share_sender(message: Mapping[str, Any], senders: dict[tuple, dict]) -> None:
+    """Point ``message["from"]`` at the first identical sender dict in ``senders``."""
+    sender = message.get("from")
+    if isinstance(message, dict) and isinstance(sender, dict):
+        try:
+            message["from"] = senders.setdefault(tuple(sender.items()), sender)
+        except TypeError:  # unhashable nested values
+            pass
+
+
+def normalize_message(message: object) -> Optional[Mapping[str, Any]]:
+    if not isinstance(message, MAPPING_TYPES):
         return None
     message_id = message.get("id")
     if not message_id:
         print("  skipping message without an id", file=sys.stderr)
         return None
-    return dict(message)
+    # Messages are returned as-is rather than copied: callers only read them,
+    # and lazy simdjson proxies would be materialized by a copy.
+    return message
+
+
+@dataclass
+class PageArrays:
+    """Column-oriented copy of the fields the Textual table displays for a page."""
+
+    created_ns: array
+    ids: list[str]
+    times: list[str]
+    senders: list[str]
+    texts: list[str]
+
+    @classmethod
+    def from_messages(cls, messages: Iterable[Mapping[str, Any]]) -> PageArrays:
+        columns = cls(array("q"), [], [], [], [])
+        for data in messages:
+            created_time = data.get("created_time")
+            created = parse_created_time(created_time) or EPOCH
+            columns.created_ns.append((created - EPOCH) // timedelta(microseconds=1) * 1000)
+            columns.ids.append(data.get("id", ""))
+            columns.times.append(format_timestamp(created_time))
+            sender = data.get("from")
+            if isinstance(sender, MAPPING_TYPES):
+                columns.senders.append(sender.get("username") or sender.get("id") or "")
+            else:
+                columns.senders.append("")
+            columns.texts.append(extract_message_text(data) or "")
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def sorted(self, *, reverse: bool = False) -> PageArrays:
+        """Return a copy ordered by creation time and id, keeping ties stable."""
+        created_ns, ids = self.created_ns, self.ids
+        order = sorted(range(len(self)), key=lambda i: (created_ns[i], ids[i]), reverse=reverse)
+        return PageArrays(
+            array("q", [self.created_ns[i] for i in order]),
+            [self.ids[i] for i in order],
+            [self.times[i] for i in order],
+            [self.senders[i] for i in order],
+            [self.texts[i] for i in order],
+        )
+
+    def rows(self) -> Iterator[tuple[str, str, str]]:
+        return zip(self.times, self.senders, self.texts)
 
 
 @dataclass
 class ConversationPage:
     identifier: Optional[str]
-    messages: list[dict]
+    messages: PageArrays
     next_url: Optional[str]
     previous_url: Optional[str]
 
 
 class ConversationPager:
-    """Lazy page fetcher that caches enriched conversation pages."""
+    """Lazy page fetcher that keeps the most recently used pages cached."""
 
     def __init__(
         self,
@@ -203,52 +563,55 @@ class ConversationPager:
         token: str,
         *,
         order: str,
-    page_limit: int,
-) -> None:
+        page_limit: int,
+        cache_size: int = 64,
+    ) -> None:
         self._conversation_id = conversation_id
         self._token = token
         self._order = order
         self._page_limit = max(page_limit, 0)
-        self._cache: dict[Optional[str], ConversationPage] = {}
-        self._fetched = 0
+        self._cache_size = max(cache_size, 1)
+        self._cache: OrderedDict[Optional[str], ConversationPage] = OrderedDict()
+        # Distinct pages fetched so far; only tracked when a limit applies,
+        # in which case it never grows past the limit.
+        self._seen: set[Optional[str]] = set()
 
     def fetch_page(self, page_url: Optional[str] = None) -> Optional[ConversationPage]:
         key = page_url
         if key in self._cache:
+            self._cache.move_to_end(key)
             return self._cache[key]
-        if self._page_limit and self._fetched >= self._page_limit and key not in self._cache:
+        # Pages evicted from the cache may be fetched again without counting
+        # against the page limit a second time.
+        if self._page_limit and len(self._seen) >= self._page_limit and key not in self._seen:
             return None
 
         messages, paging = fetch_conversation_page(
             self._conversation_id,
             self._token,
             page_url=page_url,
-            params=None,
+            params=TABLE_MESSAGE_PARAMS,
         )
-        if messages is None:
+        if messages is None or paging is None:
             return None
 
-        detailed: list[dict] = []
-        for message in messages:
-            normalized = normalize_message(message)
-            if normalized is not None:
-                detailed.append(normalized)
-
-        key_func = lambda msg: (
-            parse_created_time(msg.get("created_time")) or EPOCH,
-            msg.get("id", ""),
+        detailed = PageArrays.from_messages(
+            normalized
+            for normalized in map(normalize_message, messages)
+            if normalized is not None
         )
-        reverse = self._order == "desc"
-        detailed.sort(key=key_func, reverse=reverse)
 
         page = ConversationPage(
             identifier=page_url,
-            messages=detailed,
-            next_url=paging.get("next") if isinstance(paging, dict) else None,
-            previous_url=paging.get("previous") if isinstance(paging, dict) else None,
+            messages=detailed.sorted(reverse=self._order == "desc"),
+            next_url=paging.get("next"),
+            previous_url=paging.get("previous"),
         )
         self._cache[key] = page
-        self._fetched += 1
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        if self._page_limit:
+            self._seen.add(key)
         return page
 
 
@@ -298,7 +661,7 @@ def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "--raw",
         action="store_true",
-        help="Print raw message JSON as it is fetched (requires --no-textual)",
+        help="Print raw message JSON instead of formatted summaries (requires --no-textual)",
     )
     parser.add_argument(
         "--page-limit",
@@ -359,7 +722,18 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
     use_textual = not args.no_textual
     if args.raw:
         use_textual = False
-    for conversation_id in iter_conversation_ids(args):
+
+    conversation_ids: Iterable[str] = iter_conversation_ids(args)
+    prefetched: Optional[Iterator[list[Sequence[Mapping[str, Any]]]]] = None
+    if args.raw and httpx is not None:
+        # Raw output has no interactive consumer, so download conversations
+        # concurrently instead of paying each one's latency in turn.
+        conversation_ids = list(conversation_ids)
+        prefetched = iter_concurrent_conversation_pages(
+            conversation_ids, args.token, args.page_limit, lazy=False
+        )
+
+    for conversation_id in conversation_ids:
         sent_anything = True
         print(f"conversation {conversation_id}:")
 
@@ -368,34 +742,45 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
             print("  load details in Textual UI…")
             continue
 
+        if prefetched is not None:
+            messages = enrich_pages(next(prefetched), args.order)
+        else:
+            messages = iter_enriched_messages(
+                conversation_id,
+                args.token,
+                args.order,
+                args.page_limit,
+                lazy=not args.raw,
+            )
+
         yielded_any = False
-        for data in iter_enriched_messages(
-            conversation_id,
-            args.token,
-            args.order,
-            args.page_limit,
-        ):
+        raw_output = bytearray()
+        for data in messages:
             yielded_any = True
             if args.raw:
-                serialized = json.dumps(data, sort_keys=True)
-                print(f"  {serialized}")
+                raw_output += b"  "
+                raw_output += dump_json_bytes(data)
+                raw_output += b"\n"
+                if len(raw_output) >= RAW_OUTPUT_BUFFER_SIZE:
+                    write_stdout_bytes(raw_output)
                 continue
 
             message_id = data.get("id")
             message_text = extract_message_text(data)
             sender_username = None
             sender = data.get("from")
-            if isinstance(sender, dict):
+            if isinstance(sender, MAPPING_TYPES):
                 sender_username = sender.get("username") or sender.get("id")
             label = sender_username or message_id or "unknown"
             if message_text:
                 print(f"  {label}: {message_text}")
             else:
                 print(f"  {label} (raw):")
-                formatted = json.dumps(data, indent=2, sort_keys=True)
-                for line in formatted.splitlines():
-                    print(f"    {line}")
+                formatted = dump_json(data, indent=True)
+                sys.stdout.write(textwrap.indent(formatted, "    ") + "\n")
 
+        if raw_output:
+            write_stdout_bytes(raw_output)
         if not yielded_any:
             print("  (no messages retrieved)")
 
@@ -645,20 +1030,13 @@ def run_textual_app(
             page_number = self._page_numbers[key]
             self._populate_table(page.messages, page_number)
 
-        def _populate_table(self, messages: list[dict], page_number: int) -> None:
+        def _populate_table(self, messages: PageArrays, page_number: int) -> None:
             self._table.clear()
             if not messages:
                 self._info_label.update(f"Page {page_number} (no messages)")
                 return
 
-            for data in messages:
-                message_text = extract_message_text(data) or ""
-                sender = data.get("from")
-                if isinstance(sender, dict):
-                    sender_label = sender.get("username") or sender.get("id") or ""
-                else:
-                    sender_label = ""
-                time_label = format_timestamp(data.get("created_time"))
+            for time_label, sender_label, message_text in messages.rows():
                 self._table.add_row(time_label, sender_label, message_text)
             self._table.scroll_home()
             self._info_label.update(f"Page {page_number}")